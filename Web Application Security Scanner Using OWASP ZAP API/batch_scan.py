@@ -1,5 +1,23 @@
 from scanner import SecurityScanner
+import argparse
+import asyncio
 import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    import aiohttp
+    from scanner_async import AsyncSecurityScanner
+    ASYNC_AVAILABLE = True
+except ImportError:
+    ASYNC_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # List of websites to scan
 websites = [
@@ -8,36 +26,106 @@ websites = [
     'http://testasp.vulnweb.com'
 ]
 
-scanner = SecurityScanner()
+# Keeps multi-line banners from interleaving when scans run in parallel
+print_lock = threading.Lock()
+
 
-results = []
+def _scan_one(scanner, url):
+    """Scan a single site and return its result dict"""
+    with print_lock:
+        print(f"\n{'='*60}")
+        print(f"Scanning: {url}")
+        print('='*60)
 
-for url in websites:
-    print(f"\n{'='*60}")
-    print(f"Scanning: {url}")
-    print('='*60)
-    
     scan_id = scanner.start_scan(url, 'quick')
-    
+
     if scan_id:
-        scanner.print_summary(scan_id)
+        with print_lock:
+            scanner.print_summary(scan_id)
         scanner.generate_report(scan_id, f'report_{scan_id}.html')
-        results.append({
+        return {
             'url': url,
             'scan_id': scan_id,
             'status': 'completed'
-        })
-    else:
-        results.append({
+        }
+    return {
+        'url': url,
+        'scan_id': None,
+        'status': 'failed'
+    }
+
+
+async def _scan_one_async(async_scanner, session, semaphore, url):
+    """Async counterpart of _scan_one, bounded by the semaphore"""
+    async with semaphore:
+        with print_lock:
+            print(f"\n{'='*60}")
+            print(f"Scanning: {url}")
+            print('='*60)
+
+        scan_id = await async_scanner.start_scan(session, url, 'quick')
+
+    if scan_id:
+        with print_lock:
+            async_scanner.scanner.print_summary(scan_id)
+        async_scanner.scanner.generate_report(scan_id, f'report_{scan_id}.html')
+        return {
             'url': url,
-            'scan_id': None,
-            'status': 'failed'
-        })
+            'scan_id': scan_id,
+            'status': 'completed'
+        }
+    return {
+        'url': url,
+        'scan_id': None,
+        'status': 'failed'
+    }
 
-# Save batch results
-with open('batch_results.json', 'w') as f:
-    json.dump(results, indent=2, fp=f)
 
-print("\n✅ Batch scan completed!")
-print(f"Total sites scanned: {len(results)}")
-print(f"Check batch_results.json for summary")
+async def _run_async(scanner, concurrency):
+    """Scan all websites on one event loop, at most `concurrency` at a time"""
+    async_scanner = AsyncSecurityScanner(scanner)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with aiohttp.ClientSession() as session:
+        return list(await asyncio.gather(
+            *[_scan_one_async(async_scanner, session, semaphore, url) for url in websites]
+        ))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Batch scan multiple websites')
+    parser.add_argument('--concurrency', type=int, default=1,
+                        help='Number of scans to run in parallel (default: 1)')
+    parser.add_argument('--async', dest='use_async', action='store_true',
+                        help='Scan via asyncio + aiohttp instead of threads')
+    args = parser.parse_args()
+
+    scanner = SecurityScanner()
+
+    max_workers = min(args.concurrency, len(websites), os.cpu_count() or 4)
+    max_workers = max(max_workers, 1)
+
+    if args.use_async and not ASYNC_AVAILABLE:
+        print("[!] aiohttp not installed. Falling back to threads.")
+        print("    Install with: pip install aiohttp")
+
+    if args.use_async and ASYNC_AVAILABLE:
+        results = asyncio.run(_run_async(scanner, max_workers))
+    else:
+        results = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(_scan_one, scanner, url): url for url in websites}
+            for future in as_completed(futures):
+                results.append(future.result())
+
+    # Save batch results
+    if ORJSON_AVAILABLE:
+        with open('batch_results.json', 'wb') as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+    else:
+        with open('batch_results.json', 'w') as f:
+            json.dump(results, indent=2, fp=f)
+
+    print("\n✅ Batch scan completed!")
+    print(f"Total sites scanned: {len(results)}")
+    print(f"Check batch_results.json for summary")
@@ -5,10 +5,19 @@ Professional 3D styled templates
 """
 
 from datetime import datetime
+import io
 import json
+import os
 import csv
 import sqlite3
+import sys
+from collections import ChainMap
+from dataclasses import dataclass
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+from html import escape as html_escape
 from pathlib import Path
+from xml.sax.saxutils import escape
 
 # PDF Generation
 try:
@@ -38,6 +47,7 @@ except ImportError:
 # Excel Generation
 try:
     import openpyxl
+    from openpyxl.cell import WriteOnlyCell
     from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
     EXCEL_AVAILABLE = True
 except ImportError:
@@ -45,104 +55,78 @@ except ImportError:
     print("[!] openpyxl not installed. Excel export disabled.")
     print("    Install with: pip install openpyxl")
 
+# Streaming Excel writer (preferred over openpyxl when installed)
+try:
+    import xlsxwriter
+    XLSXWRITER_AVAILABLE = True
+except ImportError:
+    XLSXWRITER_AVAILABLE = False
 
-class VIPReportGenerator:
-    def __init__(self, db_path='scan_results.db'):
-        self.db_path = db_path
-        
-    def get_scan_data(self, scan_id):
-        """Retrieve scan data from database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Get scan info
-        cursor.execute('SELECT * FROM scans WHERE id = ?', (scan_id,))
-        scan = cursor.fetchone()
-        
-        if not scan:
-            conn.close()
-            return None
-            
-        # Get vulnerabilities
-        cursor.execute('SELECT * FROM vulnerabilities WHERE scan_id = ?', (scan_id,))
-        vulns = cursor.fetchall()
-        
-        data = {
-            'scan_id': scan[0],
-            'target_url': scan[1],
-            'scan_type': scan[2],
-            'start_time': scan[3],
-            'end_time': scan[4],
-            'total_alerts': scan[5],
-            'high_risk': scan[6],
-            'medium_risk': scan[7],
-            'low_risk': scan[8],
-            'status': scan[9],
-            'vulnerabilities': []
-        }
-        
-        for v in vulns:
-            data['vulnerabilities'].append({
-                'id': v[0],
-                'name': v[2],
-                'severity': v[3],
-                'confidence': v[4],
-                'url': v[5],
-                'description': v[6],
-                'solution': v[7],
-                'reference': v[8]
-            })
-        
-        conn.close()
-        return data
-    
-    def generate_html_report(self, scan_id, output_file='report.html'):
-        """Generate VIP HTML Report with 3D styling"""
-        data = self.get_scan_data(scan_id)
-        if not data:
-            print(f"[!] Scan {scan_id} not found")
-            return False
-        
-        html = f'''
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Security Scan Report - {data['target_url']}</title>
-    <style>
-        * {{
+# HTML templating (falls back to built-in string rendering)
+try:
+    from jinja2 import Environment, FileSystemLoader
+    JINJA_AVAILABLE = True
+except ImportError:
+    JINJA_AVAILABLE = False
+
+# Fast JSON encoding (falls back to the stdlib json module)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+TEMPLATES_DIR = Path(__file__).parent / 'templates'
+
+# Optional pre-styled DOCX shell; falls back to python-docx defaults
+_DOCX_TEMPLATE = TEMPLATES_DIR / 'report_template.docx'
+
+_RULE = "=" * 60
+
+# Indexed by bool(success)
+_STATUS = ("❌ FAILED", "✅ SUCCESS")
+
+_BANNER = """
+    ╔═══════════════════════════════════════════════════════════╗
+    ║           VIP REPORT GENERATOR v2.0                      ║
+    ║    Multiple Formats: HTML, PDF, JSON, CSV, DOCX, Excel  ║
+    ╚═══════════════════════════════════════════════════════════╝
+"""
+
+# Stylesheet for the built-in (non-Jinja) HTML renderer, parsed once at import
+_REPORT_CSS = '''
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
-        
-        body {{
+        }
+
+        body {
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             padding: 40px 20px;
             min-height: 100vh;
-        }}
-        
-        .container {{
+        }
+
+        .container {
             max-width: 1200px;
             margin: 0 auto;
             background: white;
             border-radius: 20px;
             box-shadow: 0 20px 60px rgba(0,0,0,0.3);
             overflow: hidden;
-        }}
-        
-        .header {{
+        }
+
+        .header {
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             color: white;
             padding: 60px 40px;
             text-align: center;
             position: relative;
             overflow: hidden;
-        }}
-        
-        .header::before {{
+        }
+
+        .header::before {
             content: '';
             position: absolute;
             top: -50%;
@@ -151,37 +135,37 @@ class VIPReportGenerator:
             height: 200%;
             background: radial-gradient(circle, rgba(255,255,255,0.1) 0%, transparent 70%);
             animation: pulse 15s ease-in-out infinite;
-        }}
-        
-        @keyframes pulse {{
-            0%, 100% {{ transform: scale(1); }}
-            50% {{ transform: scale(1.1); }}
-        }}
-        
-        .header h1 {{
+        }
+
+        @keyframes pulse {
+            0%, 100% { transform: scale(1); }
+            50% { transform: scale(1.1); }
+        }
+
+        .header h1 {
             font-size: 3em;
             margin-bottom: 10px;
             text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
             position: relative;
             z-index: 1;
-        }}
-        
-        .header .subtitle {{
+        }
+
+        .header .subtitle {
             font-size: 1.2em;
             opacity: 0.9;
             position: relative;
             z-index: 1;
-        }}
-        
-        .summary {{
+        }
+
+        .summary {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
             gap: 30px;
             padding: 40px;
             background: #f8f9fa;
-        }}
-        
-        .stat-card {{
+        }
+
+        .stat-card {
             background: white;
             padding: 30px;
             border-radius: 15px;
@@ -190,106 +174,106 @@ class VIPReportGenerator:
             transition: all 0.3s ease;
             position: relative;
             overflow: hidden;
-        }}
-        
-        .stat-card::before {{
+        }
+
+        .stat-card::before {
             content: '';
             position: absolute;
             top: 0;
             left: 0;
             width: 100%;
             height: 5px;
-        }}
-        
-        .stat-card.total::before {{ background: linear-gradient(90deg, #667eea, #764ba2); }}
-        .stat-card.high::before {{ background: linear-gradient(90deg, #f093fb, #f5576c); }}
-        .stat-card.medium::before {{ background: linear-gradient(90deg, #ffecd2, #fcb69f); }}
-        .stat-card.low::before {{ background: linear-gradient(90deg, #a8edea, #fed6e3); }}
-        
-        .stat-card:hover {{
+        }
+
+        .stat-card.total::before { background: linear-gradient(90deg, #667eea, #764ba2); }
+        .stat-card.high::before { background: linear-gradient(90deg, #f093fb, #f5576c); }
+        .stat-card.medium::before { background: linear-gradient(90deg, #ffecd2, #fcb69f); }
+        .stat-card.low::before { background: linear-gradient(90deg, #a8edea, #fed6e3); }
+
+        .stat-card:hover {
             transform: translateY(-10px);
             box-shadow: 0 15px 40px rgba(0,0,0,0.2);
-        }}
-        
-        .stat-card h3 {{
+        }
+
+        .stat-card h3 {
             font-size: 0.9em;
             color: #666;
             margin-bottom: 10px;
             text-transform: uppercase;
             letter-spacing: 1px;
-        }}
-        
-        .stat-card .number {{
+        }
+
+        .stat-card .number {
             font-size: 3em;
             font-weight: bold;
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             -webkit-background-clip: text;
             -webkit-text-fill-color: transparent;
-        }}
-        
-        .stat-card.high .number {{
+        }
+
+        .stat-card.high .number {
             background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
             -webkit-background-clip: text;
             -webkit-text-fill-color: transparent;
-        }}
-        
-        .stat-card.medium .number {{
+        }
+
+        .stat-card.medium .number {
             background: linear-gradient(135deg, #ffecd2 0%, #fcb69f 100%);
             -webkit-background-clip: text;
             -webkit-text-fill-color: transparent;
-        }}
-        
-        .stat-card.low .number {{
+        }
+
+        .stat-card.low .number {
             background: linear-gradient(135deg, #a8edea 0%, #fed6e3 100%);
             -webkit-background-clip: text;
             -webkit-text-fill-color: transparent;
-        }}
-        
-        .info-section {{
+        }
+
+        .info-section {
             padding: 40px;
             background: white;
-        }}
-        
-        .info-grid {{
+        }
+
+        .info-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
             gap: 20px;
             margin-bottom: 40px;
-        }}
-        
-        .info-item {{
+        }
+
+        .info-item {
             padding: 20px;
             background: #f8f9fa;
             border-radius: 10px;
             border-left: 4px solid #667eea;
-        }}
-        
-        .info-item label {{
+        }
+
+        .info-item label {
             font-weight: bold;
             color: #667eea;
             display: block;
             margin-bottom: 5px;
-        }}
-        
-        .info-item value {{
+        }
+
+        .info-item value {
             color: #333;
-        }}
-        
-        .vulnerabilities {{
+        }
+
+        .vulnerabilities {
             padding: 40px;
             background: white;
-        }}
-        
-        .section-title {{
+        }
+
+        .section-title {
             font-size: 2em;
             margin-bottom: 30px;
             color: #333;
             text-align: center;
             position: relative;
             padding-bottom: 15px;
-        }}
-        
-        .section-title::after {{
+        }
+
+        .section-title::after {
             content: '';
             position: absolute;
             bottom: 0;
@@ -299,9 +283,9 @@ class VIPReportGenerator:
             height: 4px;
             background: linear-gradient(90deg, #667eea, #764ba2);
             border-radius: 2px;
-        }}
-        
-        .vuln-card {{
+        }
+
+        .vuln-card {
             background: white;
             border-radius: 15px;
             padding: 30px;
@@ -309,31 +293,31 @@ class VIPReportGenerator:
             box-shadow: 0 5px 20px rgba(0,0,0,0.1);
             border-left: 6px solid #ddd;
             transition: all 0.3s ease;
-        }}
-        
-        .vuln-card:hover {{
+        }
+
+        .vuln-card:hover {
             box-shadow: 0 10px 30px rgba(0,0,0,0.15);
             transform: translateX(5px);
-        }}
-        
-        .vuln-card.high {{ border-left-color: #f5576c; }}
-        .vuln-card.medium {{ border-left-color: #fcb69f; }}
-        .vuln-card.low {{ border-left-color: #a8edea; }}
-        
-        .vuln-header {{
+        }
+
+        .vuln-card.high { border-left-color: #f5576c; }
+        .vuln-card.medium { border-left-color: #fcb69f; }
+        .vuln-card.low { border-left-color: #a8edea; }
+
+        .vuln-header {
             display: flex;
             justify-content: space-between;
             align-items: center;
             margin-bottom: 20px;
-        }}
-        
-        .vuln-title {{
+        }
+
+        .vuln-title {
             font-size: 1.5em;
             color: #333;
             font-weight: bold;
-        }}
-        
-        .severity-badge {{
+        }
+
+        .severity-badge {
             padding: 8px 20px;
             border-radius: 25px;
             font-weight: bold;
@@ -341,64 +325,64 @@ class VIPReportGenerator:
             text-transform: uppercase;
             letter-spacing: 1px;
             box-shadow: 0 4px 10px rgba(0,0,0,0.2);
-        }}
-        
-        .severity-badge.high {{
+        }
+
+        .severity-badge.high {
             background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
             color: white;
-        }}
-        
-        .severity-badge.medium {{
+        }
+
+        .severity-badge.medium {
             background: linear-gradient(135deg, #ffecd2 0%, #fcb69f 100%);
             color: #8B4513;
-        }}
-        
-        .severity-badge.low {{
+        }
+
+        .severity-badge.low {
             background: linear-gradient(135deg, #a8edea 0%, #fed6e3 100%);
             color: #333;
-        }}
-        
-        .vuln-content {{
+        }
+
+        .vuln-content {
             color: #666;
             line-height: 1.8;
-        }}
-        
-        .vuln-content p {{
+        }
+
+        .vuln-content p {
             margin-bottom: 15px;
-        }}
-        
-        .vuln-content strong {{
+        }
+
+        .vuln-content strong {
             color: #333;
             display: inline-block;
             margin-right: 10px;
-        }}
-        
-        .solution-box {{
+        }
+
+        .solution-box {
             background: linear-gradient(135deg, #d4fc79 0%, #96e6a1 100%);
             padding: 20px;
             border-radius: 10px;
             margin-top: 20px;
             border-left: 4px solid #4CAF50;
-        }}
-        
-        .solution-box strong {{
+        }
+
+        .solution-box strong {
             color: #2e7d32;
             font-size: 1.1em;
-        }}
-        
-        .footer {{
+        }
+
+        .footer {
             background: #2c3e50;
             color: white;
             padding: 40px;
             text-align: center;
-        }}
-        
-        .footer p {{
+        }
+
+        .footer p {
             margin-bottom: 10px;
             opacity: 0.8;
-        }}
-        
-        .btn-3d {{
+        }
+
+        .btn-3d {
             display: inline-block;
             padding: 15px 40px;
             margin: 10px;
@@ -410,9 +394,9 @@ class VIPReportGenerator:
             transition: all 0.3s ease;
             position: relative;
             overflow: hidden;
-        }}
-        
-        .btn-3d::before {{
+        }
+
+        .btn-3d::before {
             content: '';
             position: absolute;
             top: 0;
@@ -421,46 +405,92 @@ class VIPReportGenerator:
             height: 100%;
             background: rgba(255,255,255,0.2);
             transition: all 0.3s ease;
-        }}
-        
-        .btn-3d:hover::before {{
+        }
+
+        .btn-3d:hover::before {
             left: 100%;
-        }}
-        
-        .btn-3d:hover {{
+        }
+
+        .btn-3d:hover {
             transform: translateY(-5px);
             box-shadow: 0 15px 30px rgba(0,0,0,0.4);
-        }}
-        
-        .btn-3d:active {{
+        }
+
+        .btn-3d:active {
             transform: translateY(-2px);
             box-shadow: 0 5px 10px rgba(0,0,0,0.3);
-        }}
-        
-        .btn-primary {{
+        }
+
+        .btn-primary {
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        }}
-        
-        .btn-success {{
+        }
+
+        .btn-success {
             background: linear-gradient(135deg, #11998e 0%, #38ef7d 100%);
-        }}
-        
-        .btn-danger {{
+        }
+
+        .btn-danger {
             background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
-        }}
-        
-        .action-buttons {{
+        }
+
+        .action-buttons {
             text-align: center;
             padding: 40px;
             background: #f8f9fa;
-        }}
-        
-        @media print {{
-            .action-buttons, .btn-3d {{ display: none; }}
-            body {{ background: white; }}
-            .container {{ box-shadow: none; }}
-        }}
-    </style>
+        }
+
+        @media print {
+            .action-buttons, .btn-3d { display: none; }
+            body { background: white; }
+            .container { box-shadow: none; }
+        }
+'''
+
+# Behaviour script shared by every generated report
+_REPORT_JS = '''
+        // Add smooth scroll
+        document.querySelectorAll('a[href^="#"]').forEach(anchor => {
+            anchor.addEventListener('click', function (e) {
+                e.preventDefault();
+                document.querySelector(this.getAttribute('href')).scrollIntoView({
+                    behavior: 'smooth'
+                });
+            });
+        });
+
+        // Add animation on scroll
+        const observerOptions = {
+            threshold: 0.1,
+            rootMargin: '0px 0px -100px 0px'
+        };
+
+        const observer = new IntersectionObserver((entries) => {
+            entries.forEach(entry => {
+                if (entry.isIntersecting) {
+                    entry.target.style.opacity = '1';
+                    entry.target.style.transform = 'translateY(0)';
+                }
+            });
+        }, observerOptions);
+
+        document.querySelectorAll('.vuln-card').forEach(card => {
+            card.style.opacity = '0';
+            card.style.transform = 'translateY(30px)';
+            card.style.transition = 'all 0.6s ease';
+            observer.observe(card);
+        });
+'''
+
+# Static skeleton for the built-in renderer, compiled once at import —
+# the method only fills {placeholders} via str.format_map
+_HTML_HEAD = '''
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Security Scan Report - {target_url}</title>
+    {style_block}
 </head>
 <body>
     <div class="container">
@@ -469,190 +499,580 @@ class VIPReportGenerator:
             <h1>🛡️ SECURITY SCAN REPORT</h1>
             <p class="subtitle">Comprehensive Vulnerability Assessment</p>
         </div>
-        
+
         <!-- Summary Cards -->
         <div class="summary">
             <div class="stat-card total">
                 <h3>Total Issues</h3>
-                <div class="number">{data['total_alerts']}</div>
+                <div class="number">{total_alerts}</div>
             </div>
             <div class="stat-card high">
                 <h3>High Risk</h3>
-                <div class="number">{data['high_risk']}</div>
+                <div class="number">{high_risk}</div>
             </div>
             <div class="stat-card medium">
                 <h3>Medium Risk</h3>
-                <div class="number">{data['medium_risk']}</div>
+                <div class="number">{medium_risk}</div>
             </div>
             <div class="stat-card low">
                 <h3>Low Risk</h3>
-                <div class="number">{data['low_risk']}</div>
+                <div class="number">{low_risk}</div>
             </div>
         </div>
-        
+
         <!-- Scan Information -->
         <div class="info-section">
             <h2 class="section-title">Scan Information</h2>
             <div class="info-grid">
                 <div class="info-item">
                     <label>Target URL:</label>
-                    <value>{data['target_url']}</value>
+                    <value>{target_url}</value>
                 </div>
                 <div class="info-item">
                     <label>Scan Type:</label>
-                    <value>{data['scan_type'].title()}</value>
+                    <value>{scan_type_title}</value>
                 </div>
                 <div class="info-item">
                     <label>Start Time:</label>
-                    <value>{data['start_time']}</value>
+                    <value>{start_time}</value>
                 </div>
                 <div class="info-item">
                     <label>End Time:</label>
-                    <value>{data['end_time']}</value>
+                    <value>{end_time}</value>
                 </div>
                 <div class="info-item">
                     <label>Status:</label>
-                    <value>{data['status'].title()}</value>
+                    <value>{status_title}</value>
                 </div>
                 <div class="info-item">
                     <label>Report Generated:</label>
-                    <value>{datetime.now().strftime("%Y-%m-%d %H:%M:%S")}</value>
+                    <value>{generated_at}</value>
                 </div>
             </div>
         </div>
-        
+
         <!-- Vulnerabilities -->
         <div class="vulnerabilities">
             <h2 class="section-title">Detailed Findings</h2>
 '''
-        
-        # Add vulnerabilities
-        for idx, vuln in enumerate(data['vulnerabilities'], 1):
-            severity_class = vuln['severity'].lower()
-            html += f'''
+
+_VULN_TMPL = '''
             <div class="vuln-card {severity_class}">
                 <div class="vuln-header">
-                    <div class="vuln-title">{idx}. {vuln['name']}</div>
-                    <div class="severity-badge {severity_class}">{vuln['severity']}</div>
+                    <div class="vuln-title">{idx}. {name}</div>
+                    <div class="severity-badge {severity_class}">{severity}</div>
                 </div>
                 <div class="vuln-content">
-                    <p><strong>🔍 Description:</strong> {vuln['description']}</p>
-                    <p><strong>📍 Location:</strong> {vuln['url']}</p>
-                    <p><strong>🎯 Confidence:</strong> {vuln['confidence']}</p>
+                    <p><strong>🔍 Description:</strong> {description}</p>
+                    <p><strong>📍 Location:</strong> {url}</p>
+                    <p><strong>🎯 Confidence:</strong> {confidence}</p>
 '''
-            
-            if vuln['solution']:
-                html += f'''
+
+_VULN_SOLUTION_TMPL = '''
                     <div class="solution-box">
                         <p><strong>💡 Recommended Solution:</strong></p>
-                        <p>{vuln['solution']}</p>
+                        <p>{solution}</p>
                     </div>
 '''
-            
-            if vuln['reference']:
-                html += f'''
-                    <p><strong>📚 Reference:</strong> {vuln['reference']}</p>
+
+_VULN_REFERENCE_TMPL = '''
+                    <p><strong>📚 Reference:</strong> {reference}</p>
 '''
-            
-            html += '''
+
+_VULN_CLOSE = '''
                 </div>
             </div>
 '''
-        
-        html += '''
+
+_HTML_TAIL = '''
         </div>
-        
+
         <!-- Action Buttons -->
         <div class="action-buttons">
             <a href="#" onclick="window.print(); return false;" class="btn-3d btn-primary">🖨️ Print Report</a>
             <a href="#" onclick="window.location.reload();" class="btn-3d btn-success">🔄 Refresh</a>
             <a href="#" class="btn-3d btn-danger">📧 Email Report</a>
         </div>
-        
+
         <!-- Footer -->
         <div class="footer">
             <p><strong>Generated by Web Security Scanner v1.0</strong></p>
-            <p>Powered by OWASP ZAP | Report ID: ''' + str(scan_id) + '''</p>
-            <p>© ''' + str(datetime.now().year) + ''' - All Rights Reserved</p>
+            <p>Powered by OWASP ZAP | Report ID: {scan_id}</p>
+            <p>© {year} - All Rights Reserved</p>
         </div>
     </div>
-    
-    <script>
-        // Add smooth scroll
-        document.querySelectorAll('a[href^="#"]').forEach(anchor => {
-            anchor.addEventListener('click', function (e) {
-                e.preventDefault();
-                document.querySelector(this.getAttribute('href')).scrollIntoView({
-                    behavior: 'smooth'
-                });
-            });
-        });
-        
-        // Add animation on scroll
-        const observerOptions = {
-            threshold: 0.1,
-            rootMargin: '0px 0px -100px 0px'
-        };
-        
-        const observer = new IntersectionObserver((entries) => {
-            entries.forEach(entry => {
-                if (entry.isIntersecting) {
-                    entry.target.style.opacity = '1';
-                    entry.target.style.transform = 'translateY(0)';
-                }
-            });
-        }, observerOptions);
-        
-        document.querySelectorAll('.vuln-card').forEach(card => {
-            card.style.opacity = '0';
-            card.style.transform = 'translateY(30px)';
-            card.style.transition = 'all 0.6s ease';
-            observer.observe(card);
-        });
-    </script>
+
+    {script_block}
 </body>
 </html>
 '''
-        
-        # Save HTML file
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(html)
-        
+
+
+
+@dataclass(frozen=True, slots=True)
+class ScanBundle:
+    """Everything one report needs, fetched from the database exactly once
+    and safe to hand to several generators (or pickle to worker processes)."""
+    scan: dict
+    vulnerabilities: tuple
+
+    def as_data(self):
+        """Flat dict in the shape the generators render from"""
+        data = dict(self.scan)
+        data['vulnerabilities'] = list(self.vulnerabilities)
+        return data
+
+
+def _dumps(obj):
+    """Encode one object to JSON bytes, via orjson when available.
+
+    default=str keeps both encoders tolerant of non-JSON scalars
+    (e.g. datetime values) should the schema ever grow them.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str)
+    return json.dumps(obj, ensure_ascii=False, default=str).encode('utf-8')
+
+
+def _escape_fields(record):
+    """Escape every string field of a row dict once, for markup output.
+
+    ZAP alert text regularly contains <, > and & (payload echoes); escaping
+    here keeps the generated HTML well-formed and un-scriptable without
+    re-escaping the same strings inside the render loop.
+    """
+    return {k: html_escape(v, quote=True) if isinstance(v, str) else v
+            for k, v in record.items()}
+
+
+@lru_cache(maxsize=None)
+def _pdf_styles():
+    """Build the reportlab paragraph styles once per process.
+
+    Only called from the PDF path, so the reportlab names are guaranteed
+    to be bound when this runs.
+    """
+    styles = getSampleStyleSheet()
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=24,
+        textColor=colors.HexColor('#667eea'),
+        spaceAfter=30,
+        alignment=TA_CENTER
+    )
+    heading_style = ParagraphStyle(
+        'CustomHeading',
+        parent=styles['Heading2'],
+        fontSize=16,
+        textColor=colors.HexColor('#764ba2'),
+        spaceAfter=12
+    )
+    return styles, title_style, heading_style
+
+
+@lru_cache(maxsize=None)
+def _summary_table_style():
+    return TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#667eea')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 14),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black)
+    ])
+
+
+@lru_cache(maxsize=None)
+def _info_table_style():
+    return TableStyle([
+        ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black),
+        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold')
+    ])
+
+
+@lru_cache(maxsize=None)
+def _findings_table_style():
+    return TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#667eea')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 1), (-1, -1), 9),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black)
+    ])
+
+
+def _drop_page_cache(path):
+    """Flush a finished report and ask the kernel to evict it from the
+    page cache, so big report batches don't push hotter pages (the SQLite
+    DB, templates) out of memory. No-op where posix_fadvise is missing."""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
+
+
+class _HTMLSink:
+    """Incremental writer for the string-template HTML renderer"""
+
+    def __init__(self, output_file, scan, self_contained=False):
+        self.output_file = output_file
+        if self_contained:
+            style_block = f'<style>{_REPORT_CSS}    </style>'
+            script_block = f'<script>{_REPORT_JS}    </script>'
+        else:
+            style_block = '<link rel="stylesheet" href="report_assets/style.css">'
+            script_block = '<script src="report_assets/report.js" defer></script>'
+        safe = _escape_fields(dict(scan))
+        self._extra = {
+            'style_block': style_block,
+            'script_block': script_block,
+            'scan_type_title': safe['scan_type'].title(),
+            'status_title': safe['status'].title(),
+            'generated_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            'year': datetime.now().year,
+        }
+        self._scan = scan
+        self._idx = 0
+        self._f = open(output_file, 'w', encoding='utf-8', buffering=1 << 20)
+        self._f.write(_HTML_HEAD.format_map(ChainMap(self._extra, safe)))
+
+    def on_vuln(self, vuln):
+        self._idx += 1
+        vuln = _escape_fields(vuln)
+        fields = ChainMap({'idx': self._idx, 'severity_class': vuln['severity'].lower()}, vuln)
+        self._f.write(_VULN_TMPL.format_map(fields))
+        if vuln['solution']:
+            self._f.write(_VULN_SOLUTION_TMPL.format(solution=vuln['solution']))
+        if vuln['reference']:
+            self._f.write(_VULN_REFERENCE_TMPL.format(reference=vuln['reference']))
+        self._f.write(_VULN_CLOSE)
+
+    def close(self):
+        self._f.write(_HTML_TAIL.format_map(ChainMap(self._extra, self._scan)))
+        self._f.close()
+        _drop_page_cache(self.output_file)
+        print(f"[+] VIP HTML Report generated: {self.output_file}")
+
+
+class _JSONSink:
+    """Incremental writer matching the streamed JSON report layout"""
+
+    def __init__(self, output_file, scan):
+        self.output_file = output_file
+        self._f = open(output_file, 'wb', buffering=1 << 20)
+        # Scan metadata minus its closing brace, then the findings array
+        self._f.write(_dumps(scan)[:-1])
+        self._f.write(b',"vulnerabilities":[')
+        self._first = True
+
+    def on_vuln(self, vuln):
+        if not self._first:
+            self._f.write(b',')
+        self._first = False
+        self._f.write(_dumps(vuln))
+
+    def close(self):
+        self._f.write(b']}')
+        self._f.close()
+        _drop_page_cache(self.output_file)
+        print(f"[+] JSON Report generated: {self.output_file}")
+
+
+class _CSVSink:
+    """Incremental writer matching generate_csv_report's row layout"""
+
+    def __init__(self, output_file):
+        self.output_file = output_file
+        self._f = open(output_file, 'w', newline='', encoding='utf-8', buffering=1 << 20)
+        self._writer = csv.writer(self._f, dialect='excel', quoting=csv.QUOTE_MINIMAL)
+        self._writer.writerow(['Vulnerability Name', 'Severity', 'Confidence', 'URL', 'Description', 'Solution'])
+
+    def on_vuln(self, vuln):
+        self._writer.writerow((vuln['name'], vuln['severity'], vuln['confidence'],
+                               vuln['url'], vuln['description'], vuln['solution']))
+
+    def close(self):
+        self._f.close()
+        _drop_page_cache(self.output_file)
+        print(f"[+] CSV Report generated: {self.output_file}")
+
+
+class VIPReportGenerator:
+    # Explicit column lists keep row payloads small and survive schema growth
+    _SCAN_COLS = ('scan_id', 'target_url', 'scan_type', 'start_time', 'end_time',
+                  'total_alerts', 'high_risk', 'medium_risk', 'low_risk', 'status')
+    _VULN_COLS = ('id', 'name', 'severity', 'confidence', 'url',
+                  'description', 'solution', 'reference')
+
+    _SCAN_QUERY = '''
+        SELECT id AS scan_id, target_url, scan_type, start_time, end_time,
+               total_alerts, high_risk, medium_risk, low_risk, status
+        FROM scans WHERE id = ?
+    '''
+    _VULN_QUERY = '''
+        SELECT id, alert_name AS name, risk_level AS severity, confidence, url,
+               description, solution, reference
+        FROM vulnerabilities WHERE scan_id = ?
+    '''
+
+    # One round-trip: scan columns repeat per row, vulnerability columns
+    # follow (all NULL when the scan has no findings)
+    _SCAN_VULN_QUERY = '''
+        SELECT s.id AS scan_id, s.target_url, s.scan_type, s.start_time, s.end_time,
+               s.total_alerts, s.high_risk, s.medium_risk, s.low_risk, s.status,
+               v.id, v.alert_name AS name, v.risk_level AS severity, v.confidence,
+               v.url, v.description, v.solution, v.reference
+        FROM scans s
+        LEFT JOIN vulnerabilities v ON v.scan_id = s.id
+        WHERE s.id = ?
+    '''
+
+    def __init__(self, db_path='scan_results.db', output_dir='.', verbose=True):
+        self.db_path = db_path
+        # verbose=False silences per-format progress chatter for library use
+        self.verbose = verbose
+        # Resolved once; every generated file lands relative to it
+        self._output_dir = Path(output_dir)
+        self._scan_cache = {}
+        # One long-lived connection keeps SQLite's page cache warm across
+        # reports; check_same_thread=False so worker threads may reuse it
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        # WAL lets readers run alongside the scanner's writes, and NORMAL
+        # drops the per-transaction fsync WAL no longer needs
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        # 64 MB page cache plus a 256 MB mmap window: large scans read
+        # straight out of mapped pages instead of per-page syscalls
+        self._conn.execute('PRAGMA cache_size=-65536')
+        self._conn.execute('PRAGMA mmap_size=268435456')
+        # Big scans query vulnerabilities by scan_id constantly; index it once
+        self._conn.execute(
+            'CREATE INDEX IF NOT EXISTS idx_vuln_scan ON vulnerabilities(scan_id)')
+        self._conn.commit()
+        if JINJA_AVAILABLE:
+            # Load and compile the template once; autoescape protects the
+            # report viewer from hostile markup in scanner output
+            self._html_env = Environment(loader=FileSystemLoader(TEMPLATES_DIR),
+                                         autoescape=True)
+            self._html_tmpl = self._html_env.get_template('report.html.j2')
+
+        # Dispatch table for generate_all_formats, assembled once — the
+        # availability flags never change after import
+        registry = [
+            ('HTML', 'generate_html_report', 'html'),
+            ('JSON', 'generate_json_report', 'json'),
+            ('CSV', 'generate_csv_report', 'csv'),
+        ]
+        if PDF_AVAILABLE:
+            registry.append(('PDF', 'generate_pdf_report', 'pdf'))
+        if DOCX_AVAILABLE:
+            registry.append(('DOCX', 'generate_docx_report', 'docx'))
+        if XLSXWRITER_AVAILABLE or EXCEL_AVAILABLE:
+            registry.append(('Excel', 'generate_excel_report', 'xlsx'))
+        self._format_registry = tuple(registry)
+
+    def close(self):
+        """Close the database connection"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def invalidate(self, scan_id):
+        """Drop cached data for a scan (e.g. after it is re-run)"""
+        self._scan_cache.pop(scan_id, None)
+
+    def get_scan_data(self, scan_id):
+        """Retrieve scan data from database (cached per scan_id)"""
+        if scan_id in self._scan_cache:
+            return self._scan_cache[scan_id]
+
+        cursor = self._conn.cursor()
+        cursor.execute(self._SCAN_VULN_QUERY, (scan_id,))
+
+        data = None
+
+        # fetchmany keeps memory bounded for scans with huge finding counts;
+        # sqlite3.Row gives C-speed access by column name, no slicing offsets
+        while True:
+            rows = cursor.fetchmany(1000)
+            if not rows:
+                break
+            if data is None:
+                first = rows[0]
+                data = {k: first[k] for k in self._SCAN_COLS}
+                data['vulnerabilities'] = []
+            for row in rows:
+                # LEFT JOIN: vulnerability id is NULL when there are no findings
+                if row['id'] is not None:
+                    data['vulnerabilities'].append(
+                        {k: row[k] for k in self._VULN_COLS})
+
+        if data is None:
+            return None
+
+        self._scan_cache[scan_id] = data
+        return data
+
+    def _get_scan_meta(self, scan_id):
+        """Fetch just the scan row (no vulnerabilities) as a dict"""
+        cached = self._scan_cache.get(scan_id)
+        if cached is not None:
+            return {k: cached[k] for k in self._SCAN_COLS}
+        cursor = self._conn.cursor()
+        cursor.execute(self._SCAN_QUERY, (scan_id,))
+        scan = cursor.fetchone()
+        if not scan:
+            return None
+        return {k: scan[k] for k in self._SCAN_COLS}
+
+    def _iter_vulns(self, scan_id):
+        """Yield vulnerability dicts straight from the cursor in chunks,
+        so huge scans never sit fully in memory"""
+        cursor = self._conn.cursor()
+        cursor.arraysize = 1000
+        cursor.execute(self._VULN_QUERY, (scan_id,))
+        while True:
+            rows = cursor.fetchmany()
+            if not rows:
+                break
+            for row in rows:
+                yield {k: row[k] for k in self._VULN_COLS}
+
+    def _load_scan_bundle(self, scan_id):
+        """Fetch scan + vulnerabilities once, as an immutable bundle"""
+        data = self.get_scan_data(scan_id)
+        if not data:
+            return None
+        scan = {k: v for k, v in data.items() if k != 'vulnerabilities'}
+        return ScanBundle(scan=scan, vulnerabilities=tuple(data['vulnerabilities']))
+
+    def _ensure_report_assets(self, output_file):
+        """Write the shared CSS/JS sidecar files next to the report (once)"""
+        assets_dir = Path(output_file).resolve().parent / 'report_assets'
+        assets_dir.mkdir(exist_ok=True)
+        # 'x' mode writes each asset only if it isn't there yet — one
+        # syscall instead of an exists() probe followed by the open
+        for name, content in (('style.css', _REPORT_CSS), ('report.js', _REPORT_JS)):
+            try:
+                with open(assets_dir / name, 'x', encoding='utf-8') as f:
+                    f.write(content)
+            except FileExistsError:
+                pass
+
+    def generate_html_report(self, scan_id, output_file='report.html', self_contained=False, bundle=None):
+        """Generate VIP HTML Report with 3D styling
+
+        By default the ~11 KB of CSS/JS shared by every report is written
+        once to report_assets/ and referenced, so a directory of N reports
+        stores the styling once and browsers cache it. Pass
+        self_contained=True to inline everything into a single file.
+        """
+        data = bundle.as_data() if bundle is not None else self.get_scan_data(scan_id)
+        if not data:
+            print(f"[!] Scan {scan_id} not found")
+            return False
+
+        if not self_contained:
+            self._ensure_report_assets(output_file)
+
+        if JINJA_AVAILABLE:
+            # stream().dump() pushes rendered chunks straight into the file
+            # instead of building the whole document as one string first
+            stream = self._html_tmpl.stream(
+                **data,
+                generated_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                year=datetime.now().year,
+                self_contained=self_contained
+            )
+            with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                stream.dump(f)
+            _drop_page_cache(output_file)
+            print(f"[+] VIP HTML Report generated: {output_file}")
+            return True
+
+        if self_contained:
+            style_block = f'<style>{_REPORT_CSS}    </style>'
+            script_block = f'<script>{_REPORT_JS}    </script>'
+        else:
+            style_block = '<link rel="stylesheet" href="report_assets/style.css">'
+            script_block = '<script src="report_assets/report.js" defer></script>'
+
+        # Escape everything exactly once, outside the render loop; Jinja's
+        # autoescape does the equivalent on the template path
+        safe = _escape_fields({k: v for k, v in data.items() if k != 'vulnerabilities'})
+
+        extra = {
+            'style_block': style_block,
+            'script_block': script_block,
+            'scan_type_title': safe['scan_type'].title(),
+            'status_title': safe['status'].title(),
+            'generated_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            'year': datetime.now().year,
+        }
+
+        parts = [_HTML_HEAD.format_map(ChainMap(extra, safe))]
+
+        # Add vulnerabilities
+        for idx, vuln in enumerate(data['vulnerabilities'], 1):
+            vuln = _escape_fields(vuln)
+            fields = ChainMap({'idx': idx, 'severity_class': vuln['severity'].lower()}, vuln)
+            parts.append(_VULN_TMPL.format_map(fields))
+
+            if vuln['solution']:
+                parts.append(_VULN_SOLUTION_TMPL.format(solution=vuln['solution']))
+
+            if vuln['reference']:
+                parts.append(_VULN_REFERENCE_TMPL.format(reference=vuln['reference']))
+
+            parts.append(_VULN_CLOSE)
+
+        parts.append(_HTML_TAIL.format_map(ChainMap(extra, data)))
+
+        # Save HTML file with a single join + write
+        with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.write(''.join(parts))
+
+        _drop_page_cache(output_file)
         print(f"[+] VIP HTML Report generated: {output_file}")
         return True
-    
-    def generate_pdf_report(self, scan_id, output_file='report.pdf'):
+
+    def generate_pdf_report(self, scan_id, output_file='report.pdf', bundle=None):
         """Generate PDF Report"""
         if not PDF_AVAILABLE:
             print("[!] PDF generation not available. Install: pip install reportlab")
             return False
-        
-        data = self.get_scan_data(scan_id)
+
+        data = bundle.as_data() if bundle is not None else self.get_scan_data(scan_id)
         if not data:
             print(f"[!] Scan {scan_id} not found")
             return False
         
-        doc = SimpleDocTemplate(output_file, pagesize=letter)
+        # Build straight onto a buffered file handle so pages stream to
+        # disk as they are laid out instead of living in a BytesIO first
+        out = open(output_file, 'wb', buffering=1 << 20)
+        doc = SimpleDocTemplate(out, pagesize=letter)
         story = []
-        styles = getSampleStyleSheet()
-        
-        # Custom styles
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=24,
-            textColor=colors.HexColor('#667eea'),
-            spaceAfter=30,
-            alignment=TA_CENTER
-        )
-        
-        heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=styles['Heading2'],
-            fontSize=16,
-            textColor=colors.HexColor('#764ba2'),
-            spaceAfter=12
-        )
+        # Style objects are immutable for our purposes — build once, reuse
+        # across every report this process generates
+        styles, title_style, heading_style = _pdf_styles()
         
         # Title
         story.append(Paragraph("🛡️ SECURITY SCAN REPORT", title_style))
@@ -668,16 +1088,7 @@ class VIPReportGenerator:
         ]
         
         summary_table = Table(summary_data, colWidths=[3*inch, 2*inch])
-        summary_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#667eea')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 14),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
+        summary_table.setStyle(_summary_table_style())
         
         story.append(summary_table)
         story.append(Spacer(1, 30))
@@ -693,84 +1104,129 @@ class VIPReportGenerator:
         ]
         
         info_table = Table(info_data, colWidths=[2*inch, 4*inch])
-        info_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold')
-        ]))
+        info_table.setStyle(_info_table_style())
         
         story.append(info_table)
         story.append(PageBreak())
         
-        # Vulnerabilities
+        # Findings overview as one table — far fewer flowables for the
+        # layouter than a Paragraph per field, and the header repeats per page
         story.append(Paragraph("Detailed Findings", heading_style))
         story.append(Spacer(1, 20))
-        
+
+        findings_rows = [['#', 'Vulnerability', 'Severity', 'Confidence']]
+        findings_rows.extend(
+            [str(idx), escape(vuln['name']), vuln['severity'], vuln['confidence']]
+            for idx, vuln in enumerate(data['vulnerabilities'], 1)
+        )
+
+        findings_table = Table(findings_rows,
+                               colWidths=[0.5*inch, 3*inch, 1.25*inch, 1.25*inch],
+                               repeatRows=1, splitByRow=1)
+        findings_table.setStyle(_findings_table_style())
+
+        story.append(findings_table)
+        story.append(Spacer(1, 30))
+
+        # Details: one composed Paragraph per vulnerability (one markup parse
+        # each); fields are escaped so ZAP output can't break the XML
         for idx, vuln in enumerate(data['vulnerabilities'], 1):
-            story.append(Paragraph(f"<b>{idx}. {vuln['name']}</b> [{vuln['severity']}]", styles['Heading3']))
-            story.append(Paragraph(f"<b>Description:</b> {vuln['description']}", styles['Normal']))
-            story.append(Paragraph(f"<b>Location:</b> {vuln['url']}", styles['Normal']))
+            detail_lines = [
+                f"<b>{idx}. {escape(vuln['name'])}</b> [{escape(vuln['severity'])}]",
+                f"<b>Description:</b> {escape(vuln['description'])}",
+                f"<b>Location:</b> {escape(vuln['url'])}"
+            ]
             if vuln['solution']:
-                story.append(Paragraph(f"<b>Solution:</b> {vuln['solution']}", styles['Normal']))
+                detail_lines.append(f"<b>Solution:</b> {escape(vuln['solution'])}")
+            story.append(Paragraph('<br/>'.join(detail_lines), styles['Normal']))
             story.append(Spacer(1, 20))
         
         # Build PDF
-        doc.build(story)
+        try:
+            doc.build(story)
+        finally:
+            out.close()
+        _drop_page_cache(output_file)
         print(f"[+] PDF Report generated: {output_file}")
         return True
     
-    def generate_json_report(self, scan_id, output_file='report.json'):
-        """Generate JSON Report"""
-        data = self.get_scan_data(scan_id)
-        if not data:
-            print(f"[!] Scan {scan_id} not found")
-            return False
-        
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        
+    def generate_json_report(self, scan_id, output_file='report.json', bundle=None):
+        """Generate JSON Report (streamed, one vulnerability at a time)"""
+        if bundle is not None:
+            meta = bundle.scan
+            vulns = iter(bundle.vulnerabilities)
+        else:
+            meta = self._get_scan_meta(scan_id)
+            if not meta:
+                print(f"[!] Scan {scan_id} not found")
+                return False
+            vulns = self._iter_vulns(scan_id)
+
+        # Emit scan metadata, then stream the vulnerability array from the
+        # cursor — peak memory stays flat however many findings there are
+        with open(output_file, 'wb', buffering=1 << 20) as f:
+            f.write(_dumps(meta)[:-1])  # open object, drop the closing brace
+            f.write(b',"vulnerabilities":[')
+            first = True
+            for vuln in vulns:
+                if not first:
+                    f.write(b',')
+                first = False
+                f.write(_dumps(vuln))
+            f.write(b']}')
+
+        _drop_page_cache(output_file)
         print(f"[+] JSON Report generated: {output_file}")
         return True
     
-    def generate_csv_report(self, scan_id, output_file='report.csv'):
-        """Generate CSV Report"""
-        data = self.get_scan_data(scan_id)
-        if not data:
-            print(f"[!] Scan {scan_id} not found")
-            return False
-        
-        with open(output_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            
+    @staticmethod
+    def _iter_csv_rows(vulns):
+        """Yield one CSV row tuple per vulnerability"""
+        for v in vulns:
+            yield (v['name'], v['severity'], v['confidence'],
+                   v['url'], v['description'], v['solution'])
+
+    def generate_csv_report(self, scan_id, output_file='report.csv', bundle=None):
+        """Generate CSV Report (streamed, one row at a time)"""
+        if bundle is not None:
+            vulns = iter(bundle.vulnerabilities)
+        else:
+            if not self._get_scan_meta(scan_id):
+                print(f"[!] Scan {scan_id} not found")
+                return False
+            vulns = self._iter_vulns(scan_id)
+
+        with open(output_file, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+            writer = csv.writer(f, dialect='excel', quoting=csv.QUOTE_MINIMAL)
+
             # Headers
             writer.writerow(['Vulnerability Name', 'Severity', 'Confidence', 'URL', 'Description', 'Solution'])
-            
-            # Data
-            for vuln in data['vulnerabilities']:
-                writer.writerow([
-                    vuln['name'],
-                    vuln['severity'],
-                    vuln['confidence'],
-                    vuln['url'],
-                    vuln['description'],
-                    vuln['solution']
-                ])
+
+            # Data — writerows drains the row generator lazily in C, so the
+            # full row list never exists in memory
+            writer.writerows(self._iter_csv_rows(vulns))
         
+        _drop_page_cache(output_file)
         print(f"[+] CSV Report generated: {output_file}")
         return True
     
-    def generate_docx_report(self, scan_id, output_file='report.docx'):
+    def generate_docx_report(self, scan_id, output_file='report.docx', bundle=None):
         """Generate DOCX Report"""
         if not DOCX_AVAILABLE:
             print("[!] DOCX generation not available. Install: pip install python-docx")
             return False
         
-        data = self.get_scan_data(scan_id)
+        data = bundle.as_data() if bundle is not None else self.get_scan_data(scan_id)
         if not data:
             print(f"[!] Scan {scan_id} not found")
             return False
-        
-        doc = Document()
+
+        # Opening a pre-styled template skips rebuilding style objects on
+        # every run; a plain Document is the fallback when none is shipped
+        if _DOCX_TEMPLATE.exists():
+            doc = Document(os.fspath(_DOCX_TEMPLATE))
+        else:
+            doc = Document()
         
         # Title
         title = doc.add_heading('SECURITY SCAN REPORT', 0)
@@ -778,19 +1234,22 @@ class VIPReportGenerator:
         
         # Summary
         doc.add_heading('Summary', 1)
-        table = doc.add_table(rows=5, cols=2)
+        table = doc.add_table(rows=0, cols=2)
         table.style = 'Light Grid Accent 1'
-        
-        table.cell(0, 0).text = 'Total Issues'
-        table.cell(0, 1).text = str(data['total_alerts'])
-        table.cell(1, 0).text = 'High Risk'
-        table.cell(1, 1).text = str(data['high_risk'])
-        table.cell(2, 0).text = 'Medium Risk'
-        table.cell(2, 1).text = str(data['medium_risk'])
-        table.cell(3, 0).text = 'Low Risk'
-        table.cell(3, 1).text = str(data['low_risk'])
-        table.cell(4, 0).text = 'Target URL'
-        table.cell(4, 1).text = data['target_url']
+
+        summary_rows = (
+            ('Total Issues', str(data['total_alerts'])),
+            ('High Risk', str(data['high_risk'])),
+            ('Medium Risk', str(data['medium_risk'])),
+            ('Low Risk', str(data['low_risk'])),
+            ('Target URL', data['target_url']),
+        )
+        # add_row per line beats pre-allocating the grid and re-addressing
+        # cells by coordinates
+        for label, value in summary_rows:
+            cells = table.add_row().cells
+            cells[0].text = label
+            cells[1].text = value
         
         # Vulnerabilities
         doc.add_page_break()
@@ -806,52 +1265,106 @@ class VIPReportGenerator:
             doc.add_paragraph('')
         
         doc.save(output_file)
+        _drop_page_cache(output_file)
         print(f"[+] DOCX Report generated: {output_file}")
         return True
     
-    def generate_excel_report(self, scan_id, output_file='report.xlsx'):
+    def generate_excel_report(self, scan_id, output_file='report.xlsx', bundle=None):
         """Generate Excel Report"""
-        if not EXCEL_AVAILABLE:
-            print("[!] Excel generation not available. Install: pip install openpyxl")
+        if not (XLSXWRITER_AVAILABLE or EXCEL_AVAILABLE):
+            print("[!] Excel generation not available. Install: pip install xlsxwriter")
             return False
-        
-        data = self.get_scan_data(scan_id)
+
+        data = bundle.as_data() if bundle is not None else self.get_scan_data(scan_id)
         if not data:
             print(f"[!] Scan {scan_id} not found")
             return False
-        
-        wb = openpyxl.Workbook()
-        
+
+        if XLSXWRITER_AVAILABLE:
+            return self._write_excel_xlsxwriter(data, output_file)
+        return self._write_excel_openpyxl(data, output_file)
+
+    def _write_excel_xlsxwriter(self, data, output_file):
+        """Write the workbook with xlsxwriter in constant-memory mode,
+        which streams each row to disk instead of holding the sheet in RAM"""
+        wb = xlsxwriter.Workbook(output_file, {'constant_memory': True})
+
+        title_fmt = wb.add_format({'bold': True, 'font_size': 16})
+        header_fmt = wb.add_format({'bold': True, 'font_color': 'white', 'bg_color': '#667eea'})
+
         # Summary Sheet
-        ws_summary = wb.active
-        ws_summary.title = 'Summary'
-        
-        ws_summary['A1'] = 'SECURITY SCAN REPORT'
-        ws_summary['A1'].font = Font(size=16, bold=True)
-        
-        ws_summary['A3'] = 'Target URL'
-        ws_summary['B3'] = data['target_url']
-        ws_summary['A4'] = 'Scan Type'
-        ws_summary['B4'] = data['scan_type']
-        ws_summary['A5'] = 'Total Issues'
-        ws_summary['B5'] = data['total_alerts']
-        ws_summary['A6'] = 'High Risk'
-        ws_summary['B6'] = data['high_risk']
-        ws_summary['A7'] = 'Medium Risk'
-        ws_summary['B7'] = data['medium_risk']
-        ws_summary['A8'] = 'Low Risk'
-        ws_summary['B8'] = data['low_risk']
-        
+        ws_summary = wb.add_worksheet('Summary')
+        ws_summary.write(0, 0, 'SECURITY SCAN REPORT', title_fmt)
+
+        summary_rows = [
+            ('Target URL', data['target_url']),
+            ('Scan Type', data['scan_type']),
+            ('Total Issues', data['total_alerts']),
+            ('High Risk', data['high_risk']),
+            ('Medium Risk', data['medium_risk']),
+            ('Low Risk', data['low_risk']),
+        ]
+        for row, (label, value) in enumerate(summary_rows, 2):
+            ws_summary.write(row, 0, label)
+            ws_summary.write(row, 1, value)
+
+        # Vulnerabilities Sheet
+        ws_vulns = wb.add_worksheet('Vulnerabilities')
+        headers = ['#', 'Name', 'Severity', 'Confidence', 'URL', 'Description', 'Solution']
+        for col, h in enumerate(headers):
+            ws_vulns.write(0, col, h, header_fmt)
+
+        for idx, vuln in enumerate(data['vulnerabilities'], 1):
+            ws_vulns.write_row(idx, 0, (
+                idx,
+                vuln['name'],
+                vuln['severity'],
+                vuln['confidence'],
+                vuln['url'],
+                vuln['description'],
+                vuln['solution']
+            ))
+
+        wb.close()
+        _drop_page_cache(output_file)
+        print(f"[+] Excel Report generated: {output_file}")
+        return True
+
+    def _write_excel_openpyxl(self, data, output_file):
+        """openpyxl fallback, in write-only mode"""
+        # write_only streams rows straight to disk instead of building the
+        # full in-memory cell graph — O(1) memory in the number of rows
+        wb = openpyxl.Workbook(write_only=True)
+
+        # Summary Sheet
+        ws_summary = wb.create_sheet('Summary')
+
+        title_cell = WriteOnlyCell(ws_summary, value='SECURITY SCAN REPORT')
+        title_cell.font = Font(size=16, bold=True)
+        ws_summary.append([title_cell])
+        ws_summary.append([])
+
+        ws_summary.append(['Target URL', data['target_url']])
+        ws_summary.append(['Scan Type', data['scan_type']])
+        ws_summary.append(['Total Issues', data['total_alerts']])
+        ws_summary.append(['High Risk', data['high_risk']])
+        ws_summary.append(['Medium Risk', data['medium_risk']])
+        ws_summary.append(['Low Risk', data['low_risk']])
+
         # Vulnerabilities Sheet
         ws_vulns = wb.create_sheet('Vulnerabilities')
         headers = ['#', 'Name', 'Severity', 'Confidence', 'URL', 'Description', 'Solution']
-        ws_vulns.append(headers)
-        
-        # Style headers
-        for cell in ws_vulns[1]:
-            cell.font = Font(bold=True, color='FFFFFF')
-            cell.fill = PatternFill(start_color='667eea', end_color='667eea', fill_type='solid')
-        
+
+        header_font = Font(bold=True, color='FFFFFF')
+        header_fill = PatternFill(start_color='667eea', end_color='667eea', fill_type='solid')
+        header_row = []
+        for h in headers:
+            cell = WriteOnlyCell(ws_vulns, value=h)
+            cell.font = header_font
+            cell.fill = header_fill
+            header_row.append(cell)
+        ws_vulns.append(header_row)
+
         # Add vulnerabilities
         for idx, vuln in enumerate(data['vulnerabilities'], 1):
             ws_vulns.append([
@@ -863,60 +1376,147 @@ class VIPReportGenerator:
                 vuln['description'],
                 vuln['solution']
             ])
-        
-        wb.save(output_file)
+
+        buf = io.BytesIO()
+        wb.save(buf)
+        with open(output_file, 'wb', buffering=1 << 20) as f:
+            f.write(buf.getbuffer())
+        _drop_page_cache(output_file)
         print(f"[+] Excel Report generated: {output_file}")
         return True
     
+    def _emit_light_formats(self, bundle, light):
+        """Write every streaming format in one pass over the findings.
+
+        Each sink holds its own file handle and incremental state; a
+        single traversal of the vulnerability list fans each row out to
+        all of them instead of walking the list once per format.
+        """
+        sinks = {}
+        for format_name, (_method_name, filename) in light.items():
+            if self.verbose:
+                print(f"[*] Generating {format_name} report...")
+            if format_name == 'HTML':
+                self._ensure_report_assets(filename)
+                sinks[format_name] = _HTMLSink(filename, bundle.scan)
+            elif format_name == 'JSON':
+                sinks[format_name] = _JSONSink(filename, bundle.scan)
+            elif format_name == 'CSV':
+                sinks[format_name] = _CSVSink(filename)
+
+        sink_list = list(sinks.values())
+        for vuln in bundle.vulnerabilities:
+            for sink in sink_list:
+                sink.on_vuln(vuln)
+
+        results = {}
+        for format_name, sink in sinks.items():
+            sink.close()
+            results[format_name] = True
+        return results
+
     def generate_all_formats(self, scan_id, base_name='security_report'):
         """Generate reports in all available formats"""
-        print("\n" + "="*60)
+        print("\n" + _RULE)
         print("GENERATING REPORTS IN ALL FORMATS")
-        print("="*60)
-        
-        formats = {
-            'HTML': (self.generate_html_report, f'{base_name}.html'),
-            'JSON': (self.generate_json_report, f'{base_name}.json'),
-            'CSV': (self.generate_csv_report, f'{base_name}.csv'),
-        }
-        
-        if PDF_AVAILABLE:
-            formats['PDF'] = (self.generate_pdf_report, f'{base_name}.pdf')
-        
-        if DOCX_AVAILABLE:
-            formats['DOCX'] = (self.generate_docx_report, f'{base_name}.docx')
-        
-        if EXCEL_AVAILABLE:
-            formats['Excel'] = (self.generate_excel_report, f'{base_name}.xlsx')
+        print(_RULE)
         
+        formats = {name: (method_name, os.fspath(self._output_dir / f'{base_name}.{ext}'))
+                   for name, method_name, ext in self._format_registry}
+
+        # One DB fetch feeds every format; the bundle also pickles cleanly
+        # to the process-pool workers so children skip the DB entirely
+        bundle = self._load_scan_bundle(scan_id)
+        if bundle is None:
+            print(f"[!] Scan {scan_id} not found")
+            return {name: False for name in formats}
+
+        # PDF/DOCX/Excel need layout passes and are CPU-bound pure-Python
+        # work under the GIL, so they fan out to worker processes (each
+        # child renders from the pickled bundle). HTML/JSON/CSV all consume
+        # findings in order, so one traversal feeds their sinks while the
+        # workers run.
+        heavy = {name: formats[name] for name in ('PDF', 'DOCX', 'Excel') if name in formats}
+        light = {name: spec for name, spec in formats.items() if name not in heavy}
+
         results = {}
-        for format_name, (func, filename) in formats.items():
-            print(f"\n[*] Generating {format_name} report...")
-            success = func(scan_id, filename)
-            results[format_name] = success
-        
-        print("\n" + "="*60)
-        print("REPORT GENERATION SUMMARY")
-        print("="*60)
-        for format_name, success in results.items():
-            status = "✅ SUCCESS" if success else "❌ FAILED"
-            print(f"{format_name:12s} : {status}")
-        print("="*60 + "\n")
+        if heavy:
+            max_workers = min(len(heavy), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = {}
+                for format_name, (method_name, filename) in heavy.items():
+                    if self.verbose:
+                        print(f"[*] Generating {format_name} report...")
+                    futures[format_name] = executor.submit(
+                        _run_format, self.db_path, scan_id, method_name, filename, bundle)
+                # Fused pass overlaps with the worker processes
+                results.update(self._emit_light_formats(bundle, light))
+                for format_name, future in futures.items():
+                    results[format_name] = future.result()
+        else:
+            results.update(self._emit_light_formats(bundle, light))
+        
+        # One write for the whole summary block instead of a print (lock,
+        # encode, flush) per line
+        lines = ["", _RULE, "REPORT GENERATION SUMMARY", _RULE]
+        lines.extend(
+            f"{format_name:12s} : {_STATUS[bool(success)]}"
+            for format_name, success in results.items()
+        )
+        lines.append(_RULE + "\n")
+        sys.stdout.write("\n".join(lines) + "\n")
         
         return results
 
 
+def _run_format(db_path, scan_id, method_name, filename, bundle=None):
+    """Process-pool worker: build a fresh generator (and with it a private
+    SQLite connection) in the child and run one format by method name —
+    names pickle across the spawn boundary, bound methods don't."""
+    generator = VIPReportGenerator(db_path)
+    try:
+        return getattr(generator, method_name)(scan_id, filename, bundle=bundle)
+    finally:
+        generator.close()
+
+
 # Main execution
 if __name__ == "__main__":
-    print("""
-    ╔═══════════════════════════════════════════════════════════╗
-    ║           VIP REPORT GENERATOR v2.0                      ║
-    ║    Multiple Formats: HTML, PDF, JSON, CSV, DOCX, Excel  ║
-    ╚═══════════════════════════════════════════════════════════╝
-    """)
-    
-    generator = VIPReportGenerator()
-    
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Generate scan reports in multiple formats')
+    parser.add_argument('--scan-id', type=int,
+                        help='Scan ID to report on (skips the interactive prompts)')
+    parser.add_argument('--format', dest='fmt',
+                        choices=['html', 'pdf', 'json', 'csv', 'docx', 'xlsx', 'all'],
+                        default='all', help='Report format (default: all)')
+    parser.add_argument('--output-dir', default='.',
+                        help='Directory to write reports into (default: current)')
+    args = parser.parse_args()
+
+    # Banner only for humans on a terminal, never into pipes or cron logs
+    if sys.stdout.isatty():
+        print(_BANNER)
+
+    generator = VIPReportGenerator(output_dir=args.output_dir)
+
+    if args.scan_id is not None:
+        # Non-interactive path for batch/cron use, e.g.
+        #   ls scans | xargs -n1 -P8 python report_generator.py --scan-id
+        methods = {
+            'html': generator.generate_html_report,
+            'pdf': generator.generate_pdf_report,
+            'json': generator.generate_json_report,
+            'csv': generator.generate_csv_report,
+            'docx': generator.generate_docx_report,
+            'xlsx': generator.generate_excel_report,
+        }
+        if args.fmt == 'all':
+            results = generator.generate_all_formats(args.scan_id)
+            sys.exit(0 if any(results.values()) else 1)
+        out = Path(args.output_dir) / f'security_report_{args.scan_id}.{args.fmt}'
+        sys.exit(0 if methods[args.fmt](args.scan_id, os.fspath(out)) else 1)
+
     # Get scan ID
     scan_id = input("\nEnter Scan ID: ").strip()
     
@@ -937,20 +1537,19 @@ if __name__ == "__main__":
     
     choice = input("\nYour choice (1-7): ").strip()
     
-    if choice == '1':
-        generator.generate_html_report(scan_id)
-    elif choice == '2':
-        generator.generate_pdf_report(scan_id)
-    elif choice == '3':
-        generator.generate_json_report(scan_id)
-    elif choice == '4':
-        generator.generate_csv_report(scan_id)
-    elif choice == '5':
-        generator.generate_docx_report(scan_id)
-    elif choice == '6':
-        generator.generate_excel_report(scan_id)
-    elif choice == '7':
-        generator.generate_all_formats(scan_id)
+    dispatch = {
+        '1': generator.generate_html_report,
+        '2': generator.generate_pdf_report,
+        '3': generator.generate_json_report,
+        '4': generator.generate_csv_report,
+        '5': generator.generate_docx_report,
+        '6': generator.generate_excel_report,
+        '7': generator.generate_all_formats,
+    }
+
+    action = dispatch.get(choice)
+    if action:
+        action(scan_id)
     else:
         print("[!] Invalid choice")
     
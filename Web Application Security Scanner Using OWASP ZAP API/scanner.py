@@ -5,11 +5,14 @@ Using OWASP ZAP for automated vulnerability detection
 
 import time
 import json
+from collections import Counter
 from datetime import datetime
 from zapv2 import ZAPv2
 import sqlite3
 from pathlib import Path
 
+_RULE = "=" * 60
+
 class SecurityScanner:
     def __init__(self, zap_api_key='changeme', zap_proxy='http://127.0.0.1:8080'):
         """Initialize ZAP connection"""
@@ -130,20 +133,13 @@ class SecurityScanner:
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
         
-        high_count = 0
-        medium_count = 0
-        low_count = 0
-        
+        # Counter aggregates the severities in one C-level pass
+        risk_counts = Counter(alert.get('risk', 'Informational') for alert in alerts)
+        high_count = risk_counts['High']
+        medium_count = risk_counts['Medium']
+        low_count = risk_counts['Low']
+
         for alert in alerts:
-            risk = alert.get('risk', 'Informational')
-            
-            if risk == 'High':
-                high_count += 1
-            elif risk == 'Medium':
-                medium_count += 1
-            elif risk == 'Low':
-                low_count += 1
-            
             cursor.execute('''
                 INSERT INTO vulnerabilities 
                 (scan_id, alert_name, risk_level, confidence, url, description, solution, reference)
@@ -287,9 +283,9 @@ class SecurityScanner:
         scan = cursor.fetchone()
         
         if scan:
-            print("\n" + "="*60)
+            print("\n" + _RULE)
             print("SCAN SUMMARY")
-            print("="*60)
+            print(_RULE)
             print(f"Target URL: {scan[1]}")
             print(f"Scan Type: {scan[2]}")
             print(f"Total Vulnerabilities: {scan[5]}")
@@ -297,7 +293,7 @@ class SecurityScanner:
             print(f"Medium Risk: {scan[7]}")
             print(f"Low Risk: {scan[8]}")
             print(f"Status: {scan[9]}")
-            print("="*60 + "\n")
+            print(_RULE + "\n")
         
         conn.close()
 
@@ -0,0 +1,86 @@
+"""
+Async Web Application Security Scanner
+Talks to the OWASP ZAP REST API directly with aiohttp so many
+targets can be scanned on one event loop
+"""
+
+import asyncio
+
+import aiohttp
+
+
+class AsyncSecurityScanner:
+    def __init__(self, scanner, zap_api_key='changeme', zap_base_url='http://127.0.0.1:8080'):
+        """Wrap a SecurityScanner for DB storage, scan over HTTP with aiohttp"""
+        self.scanner = scanner
+        self.api_key = zap_api_key
+        self.base_url = zap_base_url.rstrip('/')
+
+    async def _zap_get(self, session, endpoint, **params):
+        """Call a ZAP JSON API endpoint and return the parsed response"""
+        params['apikey'] = self.api_key
+        url = f"{self.base_url}/JSON/{endpoint}/"
+        async with session.get(url, params=params) as resp:
+            return await resp.json()
+
+    async def start_scan(self, session, target_url, scan_type='quick'):
+        """Async version of SecurityScanner.start_scan"""
+        print(f"\n[+] Starting {scan_type} scan for: {target_url}")
+
+        # Save scan info to database (same tables as the sync scanner)
+        scan_id = self.scanner.save_scan_info(target_url, scan_type)
+
+        try:
+            # Step 1: Access the target
+            print("[+] Accessing target URL...")
+            await self._zap_get(session, 'core/action/accessUrl', url=target_url)
+            await asyncio.sleep(2)
+
+            # Step 2: Spider the target
+            print("[+] Spidering the target...")
+            result = await self._zap_get(session, 'spider/action/scan', url=target_url)
+            spider_id = result['scan']
+
+            while True:
+                status = await self._zap_get(session, 'spider/view/status', scanId=spider_id)
+                if int(status['status']) >= 100:
+                    break
+                print(f"    Spider progress: {status['status']}%")
+                await asyncio.sleep(2)
+
+            print("[+] Spider completed")
+
+            # Step 3: Passive scan (automatic)
+            print("[+] Running passive scan...")
+            await asyncio.sleep(5)
+
+            # Step 4: Active scan (if not quick scan)
+            if scan_type != 'quick':
+                print("[+] Starting active scan...")
+                result = await self._zap_get(session, 'ascan/action/scan', url=target_url)
+                active_scan_id = result['scan']
+
+                while True:
+                    status = await self._zap_get(session, 'ascan/view/status', scanId=active_scan_id)
+                    if int(status['status']) >= 100:
+                        break
+                    print(f"    Active scan progress: {status['status']}%")
+                    await asyncio.sleep(5)
+
+                print("[+] Active scan completed")
+
+            # Step 5: Get results
+            print("[+] Collecting results...")
+            result = await self._zap_get(session, 'core/view/alerts', baseurl=target_url)
+            alerts = result['alerts']
+
+            # Process and save results
+            self.scanner.process_results(scan_id, alerts)
+
+            print(f"[+] Scan completed! Found {len(alerts)} vulnerabilities")
+            return scan_id
+
+        except Exception as e:
+            print(f"[!] Error during scan: {str(e)}")
+            self.scanner.update_scan_status(scan_id, 'failed')
+            return None